@@ -1,6 +1,7 @@
 """Core advising logic for generating automated email responses."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Protocol
 
 from .knowledge_base import KnowledgeBase
@@ -17,6 +18,15 @@ from .metadata import MetadataExtractor
 from .text_processing import augment_tokens, tokenize
 
 
+@dataclass(frozen=True)
+class _QueryAnalysis:
+    """Derived views of a query, computed once and shared per request."""
+
+    query: str
+    raw_tokens: List[str]
+    augmented_tokens: List[str]
+
+
 class _TemplateContext(dict):
     """Mapping used to safely format response templates."""
 
@@ -107,8 +117,19 @@ class EmailAdvisor:
         self.vectorizer = TfIdfVectorizer(documents)
 
     def rank_articles(self, query: str) -> List[RankedMatch]:
-        raw_query_tokens = tokenize(query)
-        query_tokens = augment_tokens(raw_query_tokens)
+        return self._rank_articles(self._analyze(query))
+
+    def _analyze(self, query: str) -> _QueryAnalysis:
+        raw_tokens = tokenize(query)
+        return _QueryAnalysis(
+            query=query,
+            raw_tokens=raw_tokens,
+            augmented_tokens=augment_tokens(raw_tokens),
+        )
+
+    def _rank_articles(self, analysis: _QueryAnalysis) -> List[RankedMatch]:
+        raw_query_tokens = analysis.raw_tokens
+        query_tokens = analysis.augmented_tokens
         token_set = set(query_tokens)
         raw_token_set = set(raw_query_tokens)
         domain_token_set = {token for token in query_tokens if token in self._domain_vocabulary}
@@ -168,7 +189,8 @@ class EmailAdvisor:
                     continue
                 metadata[fact.key] = fact.value
                 metadata_notes.append(fact.reason)
-        matches = self.rank_articles(query)
+        analysis = self._analyze(query)
+        matches = self._rank_articles(analysis)
         reasons: List[str] = []
         if not matches:
             reasons.extend(metadata_notes)
@@ -12,6 +12,17 @@ from .models import AdvisorResponse, ConfidenceSettings
 from .rag import TfidfRetriever, load_reference_corpus
 
 
+_METADATA_FIELDS = (
+    "student_name",
+    "student_id",
+    "term",
+    "registration_deadline",
+    "withdrawal_deadline",
+    "financial_aid_phone",
+    "financial_aid_email",
+)
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Generate advising email responses")
     parser.add_argument("--query", required=True, help="Student email body text")
@@ -91,15 +102,7 @@ def _build_confidence_settings(args: argparse.Namespace) -> ConfidenceSettings:
 
 def _collect_metadata(args: argparse.Namespace) -> Dict[str, str]:
     metadata: Dict[str, str] = {}
-    for field in [
-        "student_name",
-        "student_id",
-        "term",
-        "registration_deadline",
-        "withdrawal_deadline",
-        "financial_aid_phone",
-        "financial_aid_email",
-    ]:
+    for field in _METADATA_FIELDS:
         value = getattr(args, field)
         if value:
             metadata[field] = value
@@ -6,7 +6,6 @@ from dataclasses import dataclass
 from typing import Iterable, List
 
 
-_TERM_RE = re.compile(r"\b(Spring|Summer|Fall|Winter)\s*(20\d{2})\b", re.IGNORECASE)
 _MONTHS = {
     "jan": "January",
     "january": "January",
@@ -33,19 +32,52 @@ _MONTHS = {
     "dec": "December",
     "december": "December",
 }
-_MONTH_DAY_RE = re.compile(
-    r"\b(" + "|".join(_MONTHS.keys()) + r")\.?\s+(\d{1,2})(?:st|nd|rd|th)?\b",
-    re.IGNORECASE,
+_MONTH_INDEX = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+# Month alternatives share their three-letter prefixes so the engine matches
+# each name in a single forward scan instead of retrying 26 alternatives.
+_MONTH_PATTERN = (
+    r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?"
+    r"|jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?"
+    r"|nov(?:ember)?|dec(?:ember)?"
 )
-_NUMERIC_DATE_RE = re.compile(
-    r"\b(0?[1-9]|1[0-2])[/-](0?[1-9]|[12]\d|3[01])(?:[/-](20\d{2}))?\b"
+# Term and date patterns cannot overlap each other, so they are folded into
+# one alternation and ``extract`` walks the email text once for all three.
+# The name pattern stays separate: finditer yields non-overlapping matches,
+# so a greeting like "this is Fall 2025" would otherwise consume the term or
+# date it overlaps and drop that fact.
+_SCAN_RE = re.compile(
+    r"\b(?:(?P<term_season>Spring|Summer|Fall|Winter)\s*(?P<term_year>20\d{2})"
+    r"|(?P<mday_month>" + _MONTH_PATTERN + r")\.?\s+"
+    r"(?P<mday_day>\d{1,2})(?:st|nd|rd|th)?"
+    r"|(?P<num_month>0?[1-9]|1[0-2])[/-](?P<num_day>0?[1-9]|[12]\d|3[01])"
+    r"(?:[/-](?P<num_year>20\d{2}))?)\b",
+    re.IGNORECASE,
 )
 _NAME_RE = re.compile(
-    r"\b(?:my\s+name\s+is|this\s+is)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})\b",
+    r"\b(?:my\s+name\s+is|this\s+is)\s+(?P<name>[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})\b",
     re.IGNORECASE,
 )
-_WITHDRAW_KEYWORDS = {"withdraw", "withdrawal", "drop", "dropped", "remove", "removed"}
-_REGISTRATION_KEYWORDS = {"register", "registration", "enroll", "enrollment", "add"}
+_WITHDRAW_KEYWORDS = frozenset({"withdraw", "withdrawal", "drop", "dropped", "remove", "removed"})
+_REGISTRATION_KEYWORDS = frozenset({"register", "registration", "enroll", "enrollment", "add"})
+# Maps every ASCII character outside a-z to a space so ASCII context windows
+# can be tokenized with str.translate + str.split instead of a regex scan.
+# Windows containing higher code points (smart quotes, em dashes, accented
+# letters) fall back to the regex so those characters still split tokens.
+_NON_ALPHA = str.maketrans({char: " " for char in map(chr, range(128)) if not "a" <= char <= "z"})
+_ALPHA_RUN_RE = re.compile(r"[a-z]+")
 
 
 @dataclass(frozen=True)
@@ -66,43 +98,45 @@ class MetadataExtractor:
     def extract(self, text: str) -> List[MetadataFact]:
         facts: List[MetadataFact] = []
         lower_text = text.lower()
-        facts.extend(self._extract_term(text))
-        facts.extend(self._extract_dates(text, lower_text))
-        facts.extend(self._extract_name(text))
+        for match in _SCAN_RE.finditer(text):
+            if match.group("term_season"):
+                facts.extend(self._yield_term_fact(match))
+            else:
+                facts.extend(self._yield_date_facts(match, lower_text))
+        for match in _NAME_RE.finditer(text):
+            facts.extend(self._yield_name_fact(match))
         return facts
 
-    def _extract_term(self, text: str) -> Iterable[MetadataFact]:
-        for match in _TERM_RE.finditer(text):
-            term = f"{match.group(1).title()} {match.group(2)}"
-            reason = f"Detected academic term '{term}' from student email."
-            yield MetadataFact("term", term, reason)
-
-    def _extract_name(self, text: str) -> Iterable[MetadataFact]:
-        for match in _NAME_RE.finditer(text):
-            raw_name = match.group(1)
-            cleaned = " ".join(part.capitalize() for part in raw_name.split())
-            if len(cleaned) < 2:
-                continue
-            reason = f"Captured student name '{cleaned}' from greeting."
-            yield MetadataFact("student_name", cleaned, reason)
-
-    def _extract_dates(self, text: str, lower_text: str) -> Iterable[MetadataFact]:
-        for match in _MONTH_DAY_RE.finditer(text):
-            month_key = match.group(1).lower().rstrip(".")
-            day = match.group(2)
+    def _yield_term_fact(self, match: re.Match[str]) -> Iterable[MetadataFact]:
+        term = f"{match.group('term_season').title()} {match.group('term_year')}"
+        reason = f"Detected academic term '{term}' from student email."
+        yield MetadataFact("term", term, reason)
+
+    def _yield_name_fact(self, match: re.Match[str]) -> Iterable[MetadataFact]:
+        raw_name = match.group("name")
+        cleaned = " ".join(part.capitalize() for part in raw_name.split())
+        if len(cleaned) < 2:
+            return
+        reason = f"Captured student name '{cleaned}' from greeting."
+        yield MetadataFact("student_name", cleaned, reason)
+
+    def _yield_date_facts(self, match: re.Match[str], lower_text: str) -> Iterable[MetadataFact]:
+        if match.group("mday_month"):
+            month_key = match.group("mday_month").lower().rstrip(".")
+            day = match.group("mday_day")
             month = _MONTHS.get(month_key[:3])
             if not month:
-                continue
+                return
             value = f"{month} {int(day)}"
-            yield from self._yield_deadline_fact(lower_text, match.start(), match.end(), value)
-        for match in _NUMERIC_DATE_RE.finditer(text):
-            month = int(match.group(1))
-            day = int(match.group(2))
-            year = match.group(3)
-            if 1 <= month <= 12 and 1 <= day <= 31:
-                month_name = list(_MONTHS.values())[month - 1]
-                value = f"{month_name} {day}" if not year else f"{month_name} {day}, {year}"
-                yield from self._yield_deadline_fact(lower_text, match.start(), match.end(), value)
+        else:
+            month = int(match.group("num_month"))
+            day = int(match.group("num_day"))
+            year = match.group("num_year")
+            if not (1 <= month <= 12 and 1 <= day <= 31):
+                return
+            month_name = _MONTH_INDEX[month - 1]
+            value = f"{month_name} {day}" if not year else f"{month_name} {day}, {year}"
+        yield from self._yield_deadline_fact(lower_text, match.start(), match.end(), value)
 
     def _yield_deadline_fact(
         self,
@@ -112,7 +146,10 @@ class MetadataExtractor:
         value: str,
     ) -> Iterable[MetadataFact]:
         window = self._extract_window(lower_text, start, end)
-        tokens = set(re.findall(r"[a-z]+", window))
+        if window.isascii():
+            tokens = set(window.translate(_NON_ALPHA).split())
+        else:
+            tokens = set(_ALPHA_RUN_RE.findall(window))
         if _WITHDRAW_KEYWORDS & tokens:
             reason = f"Identified withdrawal deadline '{value}' in message context."
             yield MetadataFact("withdrawal_deadline", value, reason)
@@ -58,15 +58,15 @@ class ConfidenceSettings:
     ambiguity_gap: float = 0.08
 
     def __post_init__(self) -> None:  # type: ignore[override]
-        if not (0.0 <= self.review_threshold <= 1.0):
-            raise ValueError("review_threshold must be between 0 and 1")
-        if not (0.0 <= self.auto_send_threshold <= 1.0):
-            raise ValueError("auto_send_threshold must be between 0 and 1")
-        if not (0.0 <= self.ambiguity_gap <= 1.0):
-            raise ValueError("ambiguity_gap must be between 0 and 1")
-        if self.auto_send_threshold < self.review_threshold:
+        # One chained comparison covers the 0-1 bounds and the ordering
+        # requirement between the two thresholds.
+        if not (
+            0.0 <= self.review_threshold <= self.auto_send_threshold <= 1.0
+            and 0.0 <= self.ambiguity_gap <= 1.0
+        ):
             raise ValueError(
-                "auto_send_threshold must be greater than or equal to review_threshold"
+                "thresholds must satisfy 0 <= review_threshold <= auto_send_threshold <= 1 "
+                "and 0 <= ambiguity_gap <= 1"
             )
 
 
@@ -90,15 +90,14 @@ class KnowledgeBase:
     """Collection of knowledge base articles."""
 
     def __init__(self, articles: Iterable[KnowledgeArticle]):
-        self._articles: List[KnowledgeArticle] = list(articles)
+        self._articles: tuple[KnowledgeArticle, ...] = tuple(articles)
         if not self._articles:
             raise ValueError("KnowledgeBase requires at least one article")
-        seen_ids: set[str] = set()
+        self._by_id: Dict[str, KnowledgeArticle] = {}
         for article in self._articles:
-            if article.id in seen_ids:
+            if article.id in self._by_id:
                 raise ValueError(f"Duplicate article id detected: {article.id}")
-            seen_ids.add(article.id)
-        self._by_id = {article.id: article for article in self._articles}
+            self._by_id[article.id] = article
 
     def __iter__(self) -> Iterator[KnowledgeArticle]:
         return iter(self._articles)
@@ -114,22 +113,21 @@ class KnowledgeBase:
 
     @property
     def articles(self) -> Sequence[KnowledgeArticle]:
-        return tuple(self._articles)
+        return self._articles
 
 
 class ReferenceCorpus:
     """Collection of documents used for retrieval augmented generation."""
 
     def __init__(self, documents: Iterable[ReferenceDocument]):
-        self._documents: List[ReferenceDocument] = list(documents)
+        self._documents: tuple[ReferenceDocument, ...] = tuple(documents)
         if not self._documents:
             raise ValueError("ReferenceCorpus requires at least one document")
-        seen_ids: set[str] = set()
+        self._by_id: Dict[str, ReferenceDocument] = {}
         for document in self._documents:
-            if document.id in seen_ids:
+            if document.id in self._by_id:
                 raise ValueError(f"Duplicate reference id detected: {document.id}")
-            seen_ids.add(document.id)
-        self._by_id = {document.id: document for document in self._documents}
+            self._by_id[document.id] = document
 
     def __iter__(self) -> Iterator[ReferenceDocument]:
         return iter(self._documents)
@@ -145,4 +143,4 @@ class ReferenceCorpus:
 
     @property
     def documents(self) -> Sequence[ReferenceDocument]:
-        return tuple(self._documents)
+        return self._documents
@@ -4,14 +4,20 @@ from __future__ import annotations
 import json
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:  # orjson parses large corpora several times faster than stdlib json
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
 
 from .models import AdvisorReference, ReferenceCorpus, ReferenceDocument
-from .similarity import TfIdfVectorizer, cosine_similarity
+from .similarity import TfIdfVectorizer
 from .text_processing import tokenize
 
 
 _DEFAULT_CORPUS_PATH = Path(__file__).resolve().parent.parent / "data" / "reference_corpus.json"
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
 
 
 def load_reference_corpus(path: Path | str | None = None) -> ReferenceCorpus:
@@ -20,8 +26,11 @@ def load_reference_corpus(path: Path | str | None = None) -> ReferenceCorpus:
     data_path = Path(path) if path else _DEFAULT_CORPUS_PATH
     if not data_path.exists():
         raise FileNotFoundError(f"Reference corpus file not found: {data_path}")
-    with data_path.open("r", encoding="utf-8") as source:
-        payload = json.load(source)
+    if orjson is not None:
+        payload = orjson.loads(data_path.read_bytes())
+    else:
+        with data_path.open("r", encoding="utf-8") as source:
+            payload = json.load(source)
     documents: List[ReferenceDocument] = []
     for entry in payload:
         documents.append(
@@ -54,7 +63,21 @@ class TfidfRetriever:
             )
             tokenized_documents.append(tokens)
         self.vectorizer = TfIdfVectorizer(tokenized_documents)
-        self._doc_vectors = self.vectorizer.document_vectors
+        # Cheap membership test used to short-circuit retrieval for queries
+        # that share no vocabulary with the corpus.
+        self._vocabulary = frozenset(self.vectorizer.vocabulary)
+        # Sentences and their token sets are precomputed per document so that
+        # snippet building never re-splits or re-tokenizes content per query.
+        self._sentence_index: Dict[str, List[Tuple[str, frozenset[str]]]] = {}
+        for document in self._documents:
+            sentences = [
+                segment.strip()
+                for segment in _SENTENCE_RE.split(document.content)
+                if segment.strip()
+            ]
+            self._sentence_index[document.id] = [
+                (sentence, frozenset(tokenize(sentence))) for sentence in sentences
+            ]
 
     def retrieve(
         self,
@@ -71,8 +94,10 @@ class TfidfRetriever:
         query_tokens = tokenize(" ".join(query_fragments))
         if not query_tokens:
             return []
+        if self._vocabulary.isdisjoint(query_tokens):
+            return []
         scores = self.vectorizer.similarities(query_tokens)
-        candidate_indices = [
+        candidate_order = [
             idx
             for idx, score in sorted(
                 enumerate(scores), key=lambda item: item[1], reverse=True
@@ -82,30 +107,57 @@ class TfidfRetriever:
         selected_indices: List[int] = []
         references: List[AdvisorReference] = []
         token_set = set(query_tokens)
-        while candidate_indices and len(selected_indices) < limit:
+        # Selected documents are masked out rather than removed from the
+        # candidate list, so each round is a linear scan with no O(N) removal.
+        active = [False] * len(scores)
+        for idx in candidate_order:
+            active[idx] = True
+        remaining = len(candidate_order)
+        # Track each candidate's maximum similarity to the selected set and
+        # update it once per selection, so every MMR round costs one cosine
+        # per candidate instead of one per (candidate, selected) pair.
+        sim_to_selected = [0.0] * len(scores)
+        while remaining and len(selected_indices) < limit:
             best_idx = None
             best_score = float("-inf")
-            for idx in candidate_indices:
+            for idx in candidate_order:
+                if not active[idx]:
+                    continue
                 base_score = scores[idx]
                 if not selected_indices or self.diversity == 1.0:
                     mmr_score = base_score
+                    upper_bound = base_score
                 else:
-                    redundancy = max(
-                        cosine_similarity(self._doc_vectors[idx], self._doc_vectors[sel])
-                        for sel in selected_indices
+                    mmr_score = (
+                        self.diversity * base_score
+                        - (1 - self.diversity) * sim_to_selected[idx]
                     )
-                    mmr_score = self.diversity * base_score - (1 - self.diversity) * redundancy
+                    # Redundancy is non-negative, so diversity * base_score
+                    # bounds the MMR score. Candidates are sorted by base
+                    # score, so once the bound cannot beat the incumbent no
+                    # later candidate can either.
+                    upper_bound = self.diversity * base_score
+                if upper_bound <= best_score:
+                    break
                 if mmr_score > best_score:
                     best_score = mmr_score
                     best_idx = idx
             if best_idx is None:
                 break
             selected_indices.append(best_idx)
-            candidate_indices.remove(best_idx)
+            active[best_idx] = False
+            remaining -= 1
+            if self.diversity != 1.0 and remaining:
+                for idx in candidate_order:
+                    if not active[idx]:
+                        continue
+                    redundancy = self.vectorizer.document_similarity(idx, best_idx)
+                    if redundancy > sim_to_selected[idx]:
+                        sim_to_selected[idx] = redundancy
         for idx in selected_indices:
             document = self._documents[idx]
             score = scores[idx]
-            snippet = _build_snippet(document.content, token_set)
+            snippet = self._build_snippet(document, token_set)
             references.append(
                 AdvisorReference(
                     document_id=document.id,
@@ -117,20 +169,22 @@ class TfidfRetriever:
             )
         return references
 
-
-def _build_snippet(content: str, query_tokens: set[str], max_length: int = 200) -> str:
-    """Construct a snippet from *content* that mentions any of *query_tokens*."""
-
-    sentences = [segment.strip() for segment in re.split(r"(?<=[.!?])\s+", content) if segment.strip()]
-    for sentence in sentences:
-        sentence_tokens = set(tokenize(sentence))
-        if query_tokens & sentence_tokens:
-            return sentence[:max_length].strip()
-    trimmed = content.strip()
-    if len(trimmed) <= max_length:
-        return trimmed
-    snippet = trimmed[:max_length].rsplit(" ", 1)[0]
-    return snippet + "..."
+    def _build_snippet(
+        self,
+        document: ReferenceDocument,
+        query_tokens: set[str],
+        max_length: int = 200,
+    ) -> str:
+        """Construct a snippet from *document* that mentions any of *query_tokens*."""
+
+        for sentence, sentence_tokens in self._sentence_index[document.id]:
+            if query_tokens & sentence_tokens:
+                return sentence[:max_length].strip()
+        trimmed = document.content.strip()
+        if len(trimmed) <= max_length:
+            return trimmed
+        snippet = trimmed[:max_length].rsplit(" ", 1)[0]
+        return snippet + "..."
 
 
 __all__ = ["load_reference_corpus", "TfidfRetriever"]
@@ -2,11 +2,24 @@
 from __future__ import annotations
 
 import math
+import operator
+from array import array
 from collections import Counter
-from typing import Dict, List, Sequence
+from typing import Dict, List, Optional, Sequence
 
 Vector = Dict[int, float]
 
+# Vocabularies up to this size get dense float32 document rows, which are
+# contiguous in memory and cheaper to index than per-document dicts. Larger
+# vocabularies fall back to the sparse representation.
+_DENSE_VOCABULARY_LIMIT = 4096
+
+
+def _dense_dot(lhs: array, rhs: array) -> float:
+    """Dot product of two dense rows, kept on C-level iteration only."""
+
+    return sum(map(operator.mul, lhs, rhs))
+
 
 def _normalize(vector: Vector) -> Vector:
     norm = math.sqrt(sum(weight * weight for weight in vector.values()))
@@ -37,6 +50,13 @@ class TfIdfVectorizer:
         self.vocabulary: Dict[str, int] = {}
         self.idf: List[float] = []
         self.document_vectors: List[Vector] = []
+        self._dense_vectors: Optional[List[array]] = None
+        # CSR layout shared across all documents: row i occupies positions
+        # _csr_indptr[i]:_csr_indptr[i + 1] of the indices/data arrays. Only
+        # populated for vocabularies too large for the dense rows.
+        self._csr_indptr: array = array("l", [0])
+        self._csr_indices: array = array("l")
+        self._csr_data: array = array("f")
         self._build(documents)
 
     def _build(self, documents: Sequence[Sequence[str]]) -> None:
@@ -61,6 +81,20 @@ class TfIdfVectorizer:
                 weight = (1.0 + math.log(count)) * self.idf[idx]
                 vector[idx] = weight
             self.document_vectors.append(_normalize(vector))
+        if vocab_size <= _DENSE_VOCABULARY_LIMIT:
+            dense: List[array] = []
+            for vector in self.document_vectors:
+                row = array("f", bytes(4 * vocab_size))
+                for idx, weight in vector.items():
+                    row[idx] = weight
+                dense.append(row)
+            self._dense_vectors = dense
+        else:
+            for normalized in self.document_vectors:
+                for idx in sorted(normalized):
+                    self._csr_indices.append(idx)
+                    self._csr_data.append(normalized[idx])
+                self._csr_indptr.append(len(self._csr_indices))
 
     def transform(self, tokens: Sequence[str]) -> Vector:
         tf_counts = Counter(tokens)
@@ -75,7 +109,40 @@ class TfIdfVectorizer:
 
     def similarities(self, tokens: Sequence[str]) -> List[float]:
         query_vector = self.transform(tokens)
+        if self._dense_vectors is not None:
+            if not query_vector:
+                return [0.0] * len(self._dense_vectors)
+            items = list(query_vector.items())
+            return [
+                sum(row[idx] * weight for idx, weight in items)
+                for row in self._dense_vectors
+            ]
         return [cosine_similarity(query_vector, doc_vector) for doc_vector in self.document_vectors]
 
+    def document_similarity(self, lhs: int, rhs: int) -> float:
+        """Return cosine similarity between two documents in the corpus."""
+
+        if self._dense_vectors is not None:
+            return _dense_dot(self._dense_vectors[lhs], self._dense_vectors[rhs])
+        return self._sparse_document_dot(lhs, rhs)
+
+    def _sparse_document_dot(self, lhs: int, rhs: int) -> float:
+        indptr, indices, data = self._csr_indptr, self._csr_indices, self._csr_data
+        i, i_end = indptr[lhs], indptr[lhs + 1]
+        j, j_end = indptr[rhs], indptr[rhs + 1]
+        score = 0.0
+        while i < i_end and j < j_end:
+            left = indices[i]
+            right = indices[j]
+            if left == right:
+                score += data[i] * data[j]
+                i += 1
+                j += 1
+            elif left < right:
+                i += 1
+            else:
+                j += 1
+        return score
+
 
 __all__ = ["TfIdfVectorizer", "cosine_similarity"]
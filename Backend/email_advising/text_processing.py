@@ -1,6 +1,7 @@
 """Utilities for preprocessing student email text."""
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 from typing import Iterable, List, Sequence
@@ -82,13 +83,22 @@ def normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", collapsed).strip()
 
 
-def tokenize(text: str) -> List[str]:
-    """Tokenize *text* into normalized word tokens."""
-
+@functools.lru_cache(maxsize=4096)
+def _tokenize_cached(text: str) -> tuple[str, ...]:
     normalized = normalize_text(text)
     if not normalized:
-        return []
-    return [token for token in normalized.split(" ") if token and token not in _STOPWORDS]
+        return ()
+    return tuple(token for token in normalized.split(" ") if token and token not in _STOPWORDS)
+
+
+def tokenize(text: str) -> List[str]:
+    """Tokenize *text* into normalized word tokens.
+
+    Results are memoized, so repeated queries and re-surfaced document
+    sentences resolve to a cache lookup instead of re-normalizing.
+    """
+
+    return list(_tokenize_cached(text))
 
 
 def augment_tokens(tokens: Sequence[str]) -> List[str]:
@@ -0,0 +1,59 @@
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from email_advising import MetadataExtractor
+
+
+def _facts_by_key(text: str) -> dict[str, list[str]]:
+    facts: dict[str, list[str]] = {}
+    for fact in MetadataExtractor().extract(text):
+        facts.setdefault(fact.key, []).append(fact.value)
+    return facts
+
+
+def test_term_survives_overlapping_greeting() -> None:
+    facts = _facts_by_key(
+        "this is Fall 2025 and I want to register before the deadline 9/15"
+    )
+    assert facts.get("term") == ["Fall 2025"]
+
+
+def test_deadline_survives_overlapping_greeting() -> None:
+    facts = _facts_by_key(
+        "Hello, this is March 5, the withdrawal deadline I was told about."
+    )
+    assert facts.get("withdrawal_deadline") == ["March 5"]
+
+
+def test_term_survives_name_phrase_collision() -> None:
+    facts = _facts_by_key("my name is Spring 2026 registration deadline 5/1")
+    assert facts.get("term") == ["Spring 2026"]
+
+
+def test_name_extracted_from_greeting() -> None:
+    facts = _facts_by_key("Hi, my name is Taylor Smith. I have a question.")
+    assert facts.get("student_name") == ["Taylor Smith"]
+
+
+def test_numeric_date_uses_correct_month_name() -> None:
+    facts = _facts_by_key("I need to drop my class before the deadline on 3/15/2024.")
+    assert facts.get("withdrawal_deadline") == ["March 15, 2024"]
+
+
+def test_keywords_split_by_smart_quotes() -> None:
+    facts = _facts_by_key("please “withdraw” by March 5")
+    assert facts.get("withdrawal_deadline") == ["March 5"]
+
+
+def test_keywords_split_by_em_dash() -> None:
+    facts = _facts_by_key("you must drop—by March 5")
+    assert facts.get("withdrawal_deadline") == ["March 5"]
+
+
+def test_abbreviated_month_with_ordinal_day() -> None:
+    facts = _facts_by_key("Please note the Sept. 3rd withdrawal deadline.")
+    assert facts.get("withdrawal_deadline") == ["September 3"]